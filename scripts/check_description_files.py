@@ -13,6 +13,16 @@ import urllib.parse as urlparse
 from functools import wraps
 
 
+SUPPORTED_SCMURL_SCHEMES = frozenset(["git", "https", "svn"])
+
+REPOSITORY_NAME_VARIATION_PREFIXES = ("Slicer-", "Slicer_", "SlicerExtension-", "SlicerExtension_")
+
+REPOSITORY_NAME_CHECK_MESSAGE = textwrap.dedent("""
+    extension repository name is '%s'. Please, consider changing it to 'Slicer%s' or any of
+    these variations %s.
+    """)
+
+
 class ExtensionCheckError(RuntimeError):
     """Exception raised when a particular extension check failed.
     """
@@ -30,12 +40,10 @@ def require_metadata_key(metadata_key):
 
     def dec(fun):
         @wraps(fun)
-        def wrapped(*args, **kwargs):
-            extension_name = args[0]
-            metadata = args[1]
-            if metadata_key not in metadata.keys():
+        def wrapped(extension_name, metadata, **kwargs):
+            if metadata_key not in metadata:
                 raise ExtensionCheckError(extension_name, check_name, "%s key is missing" % metadata_key)
-            return fun(*args, **kwargs)
+            return fun(extension_name, metadata, **kwargs)
         return wrapped
     return dec
 
@@ -63,12 +71,11 @@ def check_scmurl_syntax(extension_name, metadata):
     if "://" not in metadata["scmurl"]:
         raise ExtensionCheckError(extension_name, check_name, "scmurl do not match scheme://host/path")
 
-    supported_schemes = ["git", "https", "svn"]
     scheme = urlparse.urlsplit(metadata["scmurl"]).scheme
-    if scheme not in supported_schemes:
+    if scheme not in SUPPORTED_SCMURL_SCHEMES:
         raise ExtensionCheckError(
             extension_name, check_name,
-            "scmurl scheme is '%s' but it should by any of %s" % (scheme, supported_schemes))
+            "scmurl scheme is '%s' but it should by any of %s" % (scheme, sorted(SUPPORTED_SCMURL_SCHEMES)))
 
 
 @require_metadata_key("scmurl")
@@ -85,15 +92,31 @@ def check_git_repository_name(extension_name, metadata):
 
     if not repo_name.startswith("Slicer"):
 
-        variations = [prefix + repo_name for prefix in ["Slicer-", "Slicer_", "SlicerExtension-", "SlicerExtension_"]]
+        variations = [prefix + repo_name for prefix in REPOSITORY_NAME_VARIATION_PREFIXES]
 
         raise ExtensionCheckError(
             extension_name, check_name,
-            textwrap.dedent("""
-            extension repository name is '%s'. Please, consider changing it to 'Slicer%s' or any of
-            these variations %s.
-            """ % (
-                repo_name, repo_name, variations)))
+            REPOSITORY_NAME_CHECK_MESSAGE % (repo_name, repo_name, variations))
+
+
+def _check_extension(file_path, checks):
+    """Run checks against a Slicer extension description file.
+    :param file_path: Path to a Slicer extension description file.
+    :param checks: List of check functions to run.
+    :return: Tuple of extension name and list of unique failure messages.
+    """
+    extension_name = os.path.splitext(os.path.basename(file_path))[0]
+
+    failures = []
+
+    metadata = parse_s4ext(file_path)
+    for check in checks:
+        try:
+            check(extension_name, metadata)
+        except ExtensionCheckError as exc:
+            failures.append(str(exc))
+
+    return extension_name, list(dict.fromkeys(failures))
 
 
 def main():
@@ -119,21 +142,11 @@ def main():
 
     file_paths = getattr(args, "/path/to/description.s4ext")
     for file_path in file_paths:
-        extension_name = os.path.splitext(os.path.basename(file_path))[0]
-
-        failures = []
- 
-        metadata = parse_s4ext(file_path)
-        for check in checks:
-            try:
-                check(extension_name, metadata)
-            except ExtensionCheckError as exc:
-                failures.append(str(exc))
-
+        extension_name, failures = _check_extension(file_path, checks)
         if failures:
             total_failure_count += len(failures)
             print("%s.s4ext" % extension_name)
-            for failure in set(failures):
+            for failure in failures:
                 print("  %s" % failure)
 
     print("Checked %d description files: Found %d errors" % (len(file_paths), total_failure_count))